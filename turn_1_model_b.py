@@ -17,21 +17,6 @@ def create_virtual_environment():
     print("Virtual environment created successfully.")
 
 
-def activate_virtual_environment():
-    """
-    Activate the virtual environment.
-    """
-    print("Activating virtual environment...")
-    if sys.platform == "win32":
-        activate_script = os.path.join("venv", "Scripts", "activate")
-    else:
-        activate_script = os.path.join("venv", "bin", "activate")
-
-    activate_command = f"source {activate_script}"
-    subprocess.run(activate_command, shell=True, check=True, cwd=WORKING_DIR)
-    print("Virtual environment activated successfully.")
-
-
 def install_dependencies():
     """
     Install dependencies from requirements.txt file.
@@ -54,26 +39,17 @@ def run_unit_tests():
 
 def verify_virtual_environment():
     """
-    Verify that the virtual environment has been created and activated successfully.
+    Verify that the virtual environment has been created successfully.
     """
     print("Verifying virtual environment...")
-    # Verify that the virtual environment is activated
-    command = ["which", "python"]
-    python_executable = subprocess.run(
-        command,
-        text=True,
-        check=True,
-        cwd=WORKING_DIR,
-        stdout=subprocess.PIPE,
-    ).stdout.strip()
-    print(f"Python executable: {python_executable}")
-
-    expected_python_executable = os.path.abspath(
-        os.path.join(WORKING_DIR, "venv/bin/python")
+    # The interpreter lives at a known path inside the venv, so there is no
+    # need to spawn `which` to look it up.
+    python_executable = os.path.abspath(
+        os.path.join(WORKING_DIR, "venv", "bin", "python")
     )
-    print(f"Expected Python executable: {expected_python_executable}")
+    print(f"Python executable: {python_executable}")
 
-    assert python_executable == expected_python_executable
+    assert os.path.isfile(python_executable)
 
     print("Virtual environment verified successfully.")
 
@@ -81,7 +57,6 @@ def verify_virtual_environment():
 def main():
     try:
         create_virtual_environment()
-        activate_virtual_environment()
         verify_virtual_environment()
         install_dependencies()
         run_unit_tests()
@@ -1,13 +1,29 @@
 #!/usr/bin/env python3
 import argparse
 import configparser
-import docker
+import copy
+import ensurepip
+import functools
+import glob
+import hashlib
+import importlib.util
+import json
 import logging
 import os
+import re
 import shutil
 import subprocess
 import sys
+import tempfile
+import time
 import venv
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
 
 # Set up logging
 logging.basicConfig(
@@ -16,6 +32,65 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+CACHE_HOME = os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache'))
+
+# Cached virtual environments, keyed by the hash of the requirements file
+VENV_CACHE_DIR = os.path.join(CACHE_HOME, 'build-venvs')
+
+# Written into a cached environment once its dependencies are installed
+VENV_COMPLETE_MARKER = '.build-complete'
+
+# Wheels prefetched while a new virtual environment is being created
+WHEEL_CACHE_DIR = os.path.join(CACHE_HOME, 'build-wheels')
+
+# Unpacked pip wheels shared by newly created virtual environments
+VENV_SEED_DIR = os.path.join(CACHE_HOME, 'venv-seed')
+
+# Default virtual environment paths, one per build context
+VENV_CONTEXT_DIR = os.path.join(CACHE_HOME, 'build-contexts')
+
+# Compiles the venv's site-packages on all CPUs once installs have finished.
+# Like pip's own compile step, files that fail to compile are not an error.
+COMPILE_SITE_PACKAGES = (
+    "import compileall, sysconfig\n"
+    "paths = {sysconfig.get_path('purelib'), sysconfig.get_path('platlib')}\n"
+    "for path in paths:\n"
+    "    compileall.compile_dir(path, quiet=1, workers=0)"
+)
+
+# Docker API version to use; 'auto' negotiates it with the daemon
+DOCKER_API_VERSION = os.environ.get('DOCKER_API_VERSION', 'auto')
+_DOCKER_CLIENT = None
+
+# Minimum interval, in seconds, between push progress log lines
+PUSH_LOG_INTERVAL = 0.1
+
+# Patterns kept out of the Docker build context
+DOCKERIGNORE_ENTRIES = [
+    "venv/", ".venv/", "**/__pycache__/", "**/*.pyc", ".pytest_cache/", ".git/"
+]
+
+
+def _default_venv_path(build_context):
+    """
+    Get the default virtual environment path for a build context.
+
+    The path lives in VENV_CONTEXT_DIR, outside the build context, and is
+    derived from the context's absolute path so that re-runs of the same
+    build reuse it. Unlike the shared temp directory, VENV_CONTEXT_DIR is
+    owned by the current user, so nobody else can plant a venv there.
+
+    Args:
+        build_context (str): Path to the build context.
+
+    Returns:
+        str: Path for the virtual environment.
+    """
+    os.makedirs(VENV_CONTEXT_DIR, mode=0o700, exist_ok=True)
+    digest = hashlib.blake2b(
+        os.path.abspath(build_context).encode(), digest_size=8)
+    return os.path.join(VENV_CONTEXT_DIR, f"venv-{digest.hexdigest()}")
+
 
 def parse_arguments():
     """
@@ -28,8 +103,9 @@ def parse_arguments():
         description="Automate Python application build and deployment process"
     )
     parser.add_argument(
-        "--venv", default="venv",
-        help="Name of the virtual environment (default: 'venv')"
+        "--venv",
+        help="Path of the virtual environment (default: a path in the "
+             "user cache directory derived from the build context)"
     )
     parser.add_argument(
         "--requirements", default="requirements.txt",
@@ -44,8 +120,18 @@ def parse_arguments():
         help="Clean up the virtual environment after the build"
     )
     parser.add_argument(
-        "--config", default="config.ini",
-        help="Path to the configuration file (default: 'config.ini')"
+        "--parallel", type=int, default=1,
+        help="Number of concurrent pip downloads (default: 1)"
+    )
+    parser.add_argument(
+        "--no-venv-cache", action="store_true",
+        help="Always build a fresh virtual environment instead of reusing "
+             "a cached one"
+    )
+    parser.add_argument(
+        "--config", default="config.toml",
+        help="Path to the TOML or INI configuration file "
+             "(default: 'config.toml')"
     )
     parser.add_argument(
         "--dockerfile", default="Dockerfile",
@@ -55,17 +141,29 @@ def parse_arguments():
         "--build-context", default=".",
         help="Path to the build context (default: current directory)"
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--build-cache",
+        help="Registry reference to use as the BuildKit layer cache"
+    )
+    args = parser.parse_args()
+    if args.venv is None:
+        args.venv = _default_venv_path(args.build_context)
+    return args
 
 
-def run_command(command, check=True, env=None):
+def run_command(command, check=True, env=None, capture=True):
     """
-    Run a shell command safely, capturing and logging its output.
+    Run a command safely, streaming its output to the log.
+
+    Standard output and standard error are merged and logged line by line as
+    the command produces them, rather than being buffered in memory.
 
     Args:
         command (list): The command and arguments to run.
         check (bool): If True, raises a CalledProcessError if the command fails.
         env (dict, optional): Environment variables to pass to the command.
+        capture (bool): If False, the command inherits this process's output
+            streams instead of having its output logged.
 
     Returns:
         subprocess.CompletedProcess: The result of the executed command.
@@ -73,32 +171,127 @@ def run_command(command, check=True, env=None):
     Raises:
         subprocess.CalledProcessError: If the command fails and `check` is True.
     """
-    try:
-        result = subprocess.run(
-            command,
-            env=env,
-            text=True,
-            check=check,
-            capture_output=True,
+    with subprocess.Popen(
+        command,
+        env=env,
+        text=True,
+        stdout=subprocess.PIPE if capture else None,
+        stderr=subprocess.STDOUT if capture else None,
+        bufsize=1,
+    ) as process:
+        if capture:
+            for line in process.stdout:
+                logger.info(f"Command output: {line.rstrip()}")
+        returncode = process.wait()
+    if check and returncode != 0:
+        logger.error(f"Command failed: {command}")
+        raise subprocess.CalledProcessError(returncode, command)
+    return subprocess.CompletedProcess(command, returncode)
+
+
+# Script installed as <venv>/bin/pip by SeededEnvBuilder
+PIP_SCRIPT = """#!{python}
+import sys
+import tempfile
+from pip._internal.cli.main import main
+sys.exit(main())
+"""
+
+
+class SeededEnvBuilder(venv.EnvBuilder):
+    """
+    Virtual environment builder that links pip in from a shared seed.
+
+    Rather than running ensurepip, which unpacks pip's bundled wheel into
+    every new environment, the unpacked wheel in `pip_seed` is symlinked
+    into the environment's site-packages.
+    """
+
+    def __init__(self, pip_seed):
+        super().__init__(with_pip=False, symlinks=True)
+        self.pip_seed = pip_seed
+
+    def post_setup(self, context):
+        site_packages = os.path.join(
+            context.env_dir, "lib",
+            f"python{sys.version_info[0]}.{sys.version_info[1]}",
+            "site-packages"
         )
-        logger.info(f"Command output (STDOUT): {result.stdout}")
-        logger.info(f"Command output (STDERR): {result.stderr}")
-        return result
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Command failed: {e.cmd}")
-        logger.error(f"Error output: {e.stderr}")
-        raise
+        for name in os.listdir(self.pip_seed):
+            os.symlink(
+                os.path.join(self.pip_seed, name),
+                os.path.join(site_packages, name)
+            )
+        pip_script = os.path.join(context.bin_path, "pip")
+        with open(pip_script, "w") as f:
+            f.write(PIP_SCRIPT.format(python=context.env_exe))
+        os.chmod(pip_script, 0o755)
+
+
+def _pip_seed(seed_dir):
+    """
+    Get a directory holding an unpacked copy of ensurepip's pip wheel.
+
+    The wheel is extracted into `seed_dir` on first use and reused by every
+    environment created afterwards.
+
+    Args:
+        seed_dir (str): Directory in which unpacked wheels are kept.
+
+    Returns:
+        str: Path to the unpacked wheel, or None if this Python does not
+        bundle a pip wheel.
+    """
+    bundled = os.path.join(os.path.dirname(ensurepip.__file__), "_bundled")
+    wheels = glob.glob(os.path.join(bundled, "pip-*.whl"))
+    if not wheels:
+        return None
+    pip_seed = os.path.join(
+        seed_dir, os.path.splitext(os.path.basename(wheels[0]))[0])
+    if not os.path.isdir(pip_seed):
+        logger.info(f"Unpacking {wheels[0]} into {pip_seed}")
+        unpack_dir = f"{pip_seed}.tmp-{os.getpid()}"
+        with zipfile.ZipFile(wheels[0]) as wheel:
+            wheel.extractall(unpack_dir)
+        try:
+            os.rename(unpack_dir, pip_seed)
+        except OSError:
+            # Another build unpacked the wheel first.
+            shutil.rmtree(unpack_dir, ignore_errors=True)
+    return pip_seed
 
 
 def create_venv(venv_name):
     """
     Create a virtual environment.
 
+    Does nothing if `venv_name` already holds a virtual environment. Uses
+    virtualenv when it is installed. Otherwise pip is linked in from
+    VENV_SEED_DIR by SeededEnvBuilder, falling back to venv.create with
+    ensurepip on Windows or when no pip wheel is bundled with Python.
+
     Args:
         venv_name (str): The name of the virtual environment to create.
     """
+    if (os.path.isfile(os.path.join(venv_name, "pyvenv.cfg"))
+            and os.path.isfile(get_venv_python(venv_name))):
+        logger.info(f"Reusing existing virtual environment: {venv_name}")
+        return
     logger.info(f"Creating virtual environment: {venv_name}")
-    venv.create(venv_name, with_pip=True)
+    try:
+        import virtualenv
+    except ImportError:
+        pip_seed = None
+        if sys.platform != "win32":
+            pip_seed = _pip_seed(VENV_SEED_DIR)
+        if pip_seed:
+            SeededEnvBuilder(pip_seed).create(venv_name)
+        else:
+            venv.create(venv_name, with_pip=True)
+    else:
+        # virtualenv seeds pip from its cached wheel image instead of
+        # unpacking the bundled wheels through ensurepip on every run.
+        virtualenv.cli_run([venv_name, "--no-periodic-update"])
 
 
 def get_venv_python(venv_name):
@@ -116,21 +309,115 @@ def get_venv_python(venv_name):
     return os.path.join(venv_name, "bin", "python")
 
 
-def install_dependencies(venv_python, requirements_file):
+def _split_requirements(requirements_file, groups):
+    """
+    Split a requirements file round-robin into groups.
+
+    No dependency analysis is done, so different groups may share
+    transitive dependencies. The groups are therefore only safe to download
+    concurrently, not to install into the same environment at once.
+
+    Args:
+        requirements_file (str): Path to the requirements file.
+        groups (int): Maximum number of groups to split the requirements into.
+
+    Returns:
+        list: Lists of requirement specifiers, or None if the file contains
+        pip options (such as -r, -c or a per-requirement --hash) that cannot
+        be passed to pip as a single command-line argument.
     """
-    Install dependencies listed in the requirements file using pip.
+    requirements = []
+    with open(requirements_file) as f:
+        for line in f:
+            line = re.sub(r"(^|\s)#.*$", "", line).strip()
+            if not line:
+                continue
+            if (line.startswith("-") or line.endswith("\\")
+                    or re.search(r"\s--", line)):
+                return None
+            requirements.append(line)
+    groups = min(groups, len(requirements))
+    return [requirements[i::groups] for i in range(groups)]
+
+
+def _download_wheels(venv_python, groups, download_dir, find_links):
+    """
+    Build wheels for groups of requirements with concurrent pip processes.
+
+    Each group gets its own subdirectory of `download_dir`, since groups
+    that share a dependency may fetch the same wheel at the same time.
+
+    Args:
+        venv_python (str): Path to the Python executable in the virtual environment.
+        groups (list): Lists of requirement specifiers.
+        download_dir (str): Directory to create the wheel directories in.
+        find_links (list): pip --find-links options to pass to each process.
+
+    Returns:
+        list: --find-links options for the wheel directories.
+    """
+    wheel_dirs = [
+        os.path.join(download_dir, str(i)) for i in range(len(groups))]
+
+    def download(group, wheel_dir):
+        run_command([
+            venv_python, "-m", "pip", "wheel", "--use-feature=fast-deps",
+            "--wheel-dir", wheel_dir, *find_links, *group
+        ], capture=False)
+
+    with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+        list(executor.map(download, groups, wheel_dirs))
+    return [option for wheel_dir in wheel_dirs
+            for option in ("--find-links", wheel_dir)]
+
+
+def install_dependencies(venv_python, requirements_file, parallel=1,
+                         wheel_dir=None):
+    """
+    Install dependencies listed in the requirements file.
+
+    Uses `uv pip install` when uv is on the PATH, since it resolves and
+    installs packages in parallel by itself. Otherwise pip is used and, when
+    `parallel` is greater than 1, the requirements are split round-robin
+    into groups whose wheels are downloaded by concurrent pip processes
+    with pip's fast-deps feature enabled. The install itself is always a
+    single pip process, so one resolver sees every requirement and nothing
+    writes to site-packages concurrently.
+    Bytecode is not compiled during the install but afterwards in a single
+    pass spread across all CPUs.
 
     Args:
         venv_python (str): Path to the Python executable in the virtual environment.
         requirements_file (str): Path to the requirements file.
+        parallel (int): Maximum number of concurrent pip downloads.
+        wheel_dir (str, optional): Directory of prebuilt wheels to install
+            from. The package index stays available for anything the
+            wheels don't cover, such as build dependencies.
 
     Logs a warning if the requirements file does not exist.
     """
     if os.path.exists(requirements_file):
         logger.info(f"Installing dependencies from {requirements_file}")
-        run_command([
-            venv_python, "-m", "pip", "install", "-r", requirements_file
-        ])
+        uv = shutil.which("uv")
+        if uv:
+            run_command([
+                uv, "pip", "install", "--python", venv_python,
+                "-r", requirements_file
+            ], capture=False)
+        else:
+            find_links = ["--find-links", wheel_dir] if wheel_dir else []
+            groups = None
+            if parallel > 1:
+                groups = _split_requirements(requirements_file, parallel)
+            with tempfile.TemporaryDirectory() as download_dir:
+                if groups:
+                    find_links += _download_wheels(
+                        venv_python, groups, download_dir, find_links)
+                run_command([
+                    venv_python, "-m", "pip", "install", "--no-compile",
+                    *find_links, "-r", requirements_file
+                ], capture=False)
+        run_command([venv_python, "-c", COMPILE_SITE_PACKAGES])
     else:
         logger.warning(
             f"Requirements file {requirements_file} not found. "
@@ -138,16 +425,161 @@ def install_dependencies(venv_python, requirements_file):
         )
 
 
+def _build_venv(venv_name, requirements_file, parallel=1):
+    """
+    Create a virtual environment and install its dependencies.
+
+    While the environment is being created, the host pip builds wheels for
+    the requirements into WHEEL_CACHE_DIR, and they are then installed from
+    there. The index is not disabled for the install, since source
+    requirements such as `-e .` still need it to fetch their build
+    dependencies. The two steps simply run in turn when uv is available (it
+    has its own parallel downloader), when the host has no pip, or when
+    there is no requirements file.
+
+    Args:
+        venv_name (str): The name of the virtual environment to create.
+        requirements_file (str): Path to the requirements file.
+        parallel (int): Maximum number of concurrent pip downloads.
+    """
+    prefetch = (
+        os.path.exists(requirements_file)
+        and not shutil.which("uv")
+        and importlib.util.find_spec("pip") is not None
+    )
+    if not prefetch:
+        create_venv(venv_name)
+        install_dependencies(
+            get_venv_python(venv_name), requirements_file, parallel)
+        return
+
+    os.makedirs(WHEEL_CACHE_DIR, exist_ok=True)
+    prefetch_command = [
+        sys.executable, "-m", "pip", "wheel", "--quiet",
+        "--wheel-dir", WHEEL_CACHE_DIR, "-r", requirements_file
+    ]
+    with subprocess.Popen(prefetch_command) as prefetch_process:
+        try:
+            create_venv(venv_name)
+        except BaseException:
+            # Don't let Popen.__exit__ wait for the whole prefetch to finish.
+            prefetch_process.kill()
+            raise
+        returncode = prefetch_process.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, prefetch_command)
+    install_dependencies(
+        get_venv_python(venv_name), requirements_file, parallel,
+        wheel_dir=WHEEL_CACHE_DIR)
+
+
+def _venv_cache_key(requirements_file):
+    """
+    Compute the cache key for a virtual environment.
+
+    The key covers the requirements file contents and the interpreter the
+    environment is created from, since a venv is tied to its base Python.
+
+    Args:
+        requirements_file (str): Path to the requirements file.
+
+    Returns:
+        str: Hex digest identifying the cached virtual environment.
+    """
+    with open(requirements_file, 'rb') as f:
+        digest = hashlib.blake2b(f.read(), digest_size=16)
+    digest.update(sys.executable.encode())
+    return digest.hexdigest()
+
+
+def prepare_venv(venv_name, requirements_file, parallel=1, use_cache=True):
+    """
+    Create a virtual environment with its dependencies installed.
+
+    Environments are cached under VENV_CACHE_DIR by the hash of the
+    requirements file and `venv_name` is symlinked to the cached copy. On a
+    cache miss the environment is built in place, since venvs can't be moved
+    once scripts reference their path. Builds of the same entry are
+    serialized with a lock file, and an entry only counts as a hit once its
+    VENV_COMPLETE_MARKER exists. An existing directory at `venv_name`
+    bypasses the cache and is used as-is, while a link left by an earlier
+    cached build is removed before building outside the cache.
+
+    Args:
+        venv_name (str): The name of the virtual environment to create.
+        requirements_file (str): Path to the requirements file.
+        parallel (int): Maximum number of concurrent pip downloads.
+        use_cache (bool): If False, always build `venv_name` from scratch.
+    """
+    cacheable = (
+        use_cache
+        and os.path.exists(requirements_file)
+        and (os.path.islink(venv_name) or not os.path.exists(venv_name))
+    )
+    if not cacheable:
+        if os.path.islink(venv_name):
+            # Don't build through a link into a cache entry keyed by other
+            # requirements.
+            os.unlink(venv_name)
+        _build_venv(venv_name, requirements_file, parallel)
+        return
+
+    cached_venv = os.path.abspath(os.path.join(
+        VENV_CACHE_DIR, _venv_cache_key(requirements_file)))
+    complete_marker = os.path.join(cached_venv, VENV_COMPLETE_MARKER)
+    os.makedirs(VENV_CACHE_DIR, exist_ok=True)
+    with open(f"{cached_venv}.lock", "w") as lock_file:
+        try:
+            import fcntl
+        except ImportError:  # Windows
+            pass
+        else:
+            # Wait for any other build of this entry to finish.
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        if os.path.exists(complete_marker):
+            logger.info(f"Reusing cached virtual environment: {cached_venv}")
+        else:
+            # Anything already here is left over from an interrupted build.
+            shutil.rmtree(cached_venv, ignore_errors=True)
+            try:
+                _build_venv(cached_venv, requirements_file, parallel)
+            except Exception:
+                shutil.rmtree(cached_venv, ignore_errors=True)
+                raise
+            open(complete_marker, "w").close()
+
+    if os.path.islink(venv_name):
+        os.unlink(venv_name)
+    os.symlink(cached_venv, venv_name, target_is_directory=True)
+
+
 def run_tests(venv_python, test_dir):
     """
-    Run unit tests using the unittest framework.
+    Run unit tests.
+
+    When pytest and pytest-xdist are installed in the virtual environment,
+    the tests are distributed across all CPUs with `pytest -n auto`.
+    Otherwise they are run with the unittest framework.
 
     Args:
         venv_python (str): Path to the Python executable in the virtual environment.
         test_dir (str): Directory containing the test files.
     """
     logger.info("Running unit tests")
-    run_command([venv_python, "-m", "unittest", test_dir])
+    probe = subprocess.run(
+        [venv_python, "-c", "import pytest, xdist"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    if probe.returncode == 0:
+        # Match unittest's default discovery pattern so test.py is collected.
+        command = [
+            venv_python, "-m", "pytest", "-n", "auto", "--dist=loadfile",
+            "-o", "python_files=test*.py", test_dir
+        ]
+    else:
+        command = [venv_python, "-m", "unittest", test_dir]
+    run_command(command)
 
 
 def cleanup(venv_name):
@@ -158,49 +590,209 @@ def cleanup(venv_name):
         venv_name (str): The name of the virtual environment to remove.
     """
     logger.info(f"Cleaning up virtual environment: {venv_name}")
-    shutil.rmtree(venv_name, ignore_errors=True)
+    if os.path.islink(venv_name):
+        # Only drop the link; the cached environment is reused by later builds.
+        os.unlink(venv_name)
+    elif sys.platform == "win32":
+        shutil.rmtree(venv_name, ignore_errors=True)
+    else:
+        # rm walks the tree with fts(3) and unlinkat(2), which is much
+        # cheaper than shutil.rmtree on the thousands of files in a venv.
+        subprocess.run(["rm", "-rf", "--", venv_name], check=False)
 
 
-def load_config(config_file):
+def _loads_simple_toml(document):
     """
-    Load configuration from a file.
+    Parse TOML with configparser, for Pythons without tomllib.
+
+    Only the subset the Docker settings need is understood: one level of
+    tables holding basic strings, integers and booleans.
 
     Args:
-        config_file (str): Path to the configuration file.
+        document (str): The TOML document.
 
     Returns:
-        configparser.ConfigParser: Parsed configuration.
+        dict: Parsed configuration.
+
+    Raises:
+        ValueError: If the document uses TOML outside that subset.
     """
-    logger.info(f"Loading configuration from {config_file}")
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.optionxform = str  # TOML keys are case-sensitive
+    try:
+        parser.read_string(document)
+    except configparser.Error as e:
+        raise ValueError(f"Unsupported TOML without tomllib: {e}") from e
+
+    def name(key):
+        if key.startswith('"'):
+            return json.loads(key)
+        if not (key.isascii()
+                and key.replace("_", "").replace("-", "").isalnum()):
+            raise ValueError(f"Unsupported TOML key without tomllib: {key}")
+        return key
+
+    config = {}
+    for section in parser.sections():
+        table = config[name(section)] = {}
+        for key, value in parser.items(section):
+            if value in ("true", "false"):
+                table[name(key)] = value == "true"
+                continue
+            try:
+                # TOML basic strings and integers are valid JSON.
+                parsed = json.loads(value)
+            except ValueError:
+                parsed = None
+            if not isinstance(parsed, (str, int)) or isinstance(parsed, bool):
+                raise ValueError(
+                    f"Unsupported TOML value for {section}.{key} without "
+                    f"tomllib: {value}")
+            table[name(key)] = parsed
+    return config
+
+
+@functools.lru_cache(maxsize=32)
+def _read_config(config_file, file_id):
+    """
+    Parse a configuration file, memoized on its identity and mtime.
+
+    Files ending in .toml are parsed with tomllib, or with
+    `_loads_simple_toml` on Python < 3.11, anything else as INI with
+    configparser. The file is only re-read once it is replaced or its size
+    or modification time changes; `load_config` hands callers copies of the
+    cached result.
+
+    Args:
+        config_file (str): Absolute path to the configuration file.
+        file_id (tuple): The file's inode, size and modification time in
+            nanoseconds, or None if the file does not exist.
+
+    Returns:
+        dict or configparser.ConfigParser: Parsed configuration.
+
+    Raises:
+        ValueError: If a TOML file can't be parsed.
+    """
+    if config_file.endswith(".toml"):
+        if file_id is None:
+            return {}
+        if tomllib is None:
+            with open(config_file, encoding="utf-8") as f:
+                return _loads_simple_toml(f.read())
+        with open(config_file, "rb") as f:
+            return tomllib.load(f)
     config = configparser.ConfigParser()
     config.read(config_file)
     return config
 
 
-def build_docker_image(image_name, dockerfile_path, build_context):
+def load_config(config_file):
     """
-    Build a Docker image.
+    Load configuration from a file.
+
+    Args:
+        config_file (str): Path to the configuration file, either TOML or INI.
+
+    Returns:
+        dict or configparser.ConfigParser: Parsed configuration.
+    """
+    logger.info(f"Loading configuration from {config_file}")
+    # Key on the absolute path so a relative name read from different
+    # working directories isn't served from the wrong project's entry.
+    config_file = os.path.abspath(config_file)
+    try:
+        stat = os.stat(config_file)
+    except FileNotFoundError:
+        file_id = None
+    else:
+        file_id = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    # Callers may modify the configuration, so never hand out the cached one.
+    return copy.deepcopy(_read_config(config_file, file_id))
+
+
+def _docker():
+    """
+    Get the Docker client shared by all image operations.
+
+    The client is created on first use so the connection pool (and the API
+    version negotiation, unless DOCKER_API_VERSION is pinned) is reused
+    across the build, tag and push steps.
+
+    Returns:
+        docker.DockerClient: Client connected to the Docker daemon.
+    """
+    # Imported here so that runs which never touch Docker (such as --help)
+    # don't pay for loading docker-py and its HTTP stack.
+    import docker
+
+    global _DOCKER_CLIENT
+    if _DOCKER_CLIENT is None:
+        _DOCKER_CLIENT = docker.from_env(
+            version=DOCKER_API_VERSION, timeout=120)
+    return _DOCKER_CLIENT
+
+
+def _ensure_dockerignore(build_context):
+    """
+    Make sure the build context's .dockerignore excludes build artifacts.
+
+    Missing DOCKERIGNORE_ENTRIES are prepended to the file, so that any
+    exceptions the project adds later in the file still take precedence.
+
+    Args:
+        build_context (str): Path to the build context.
+    """
+    dockerignore = os.path.join(build_context, ".dockerignore")
+    content = ""
+    if os.path.exists(dockerignore):
+        with open(dockerignore) as f:
+            content = f.read()
+    existing = content.splitlines()
+    missing = [entry for entry in DOCKERIGNORE_ENTRIES if entry not in existing]
+    if missing:
+        logger.info(f"Adding {', '.join(missing)} to {dockerignore}")
+        with open(dockerignore, "w") as f:
+            f.write("\n".join(missing) + "\n" + content)
+
+
+def build_docker_image(image_name, dockerfile_path, build_context,
+                       cache_ref=None):
+    """
+    Build a Docker image with BuildKit.
+
+    Shells out to `docker buildx build`, which streams the build context to
+    the daemon instead of materializing it as an in-memory tarball. When
+    `cache_ref` is given, layers are also read from and exported to that
+    registry reference. Build artifacts such as virtual environments are
+    added to the context's .dockerignore first.
 
     Args:
         image_name (str): Name for the Docker image.
-        dockerfile_path (str): Path to the Dockerfile.
+        dockerfile_path (str): Path to the Dockerfile, relative to the build
+            context.
         build_context (str): Path to the build context.
+        cache_ref (str, optional): Registry reference used as the layer cache.
 
     Returns:
         docker.models.images.Image: Built Docker image.
     """
     logger.info(f"Building Docker image: {image_name}")
-    client = docker.from_env()
-    image, build_logs = client.images.build(
-        path=build_context,
-        dockerfile=dockerfile_path,
-        tag=image_name,
-        rm=True
-    )
-    for log in build_logs:
-        if 'stream' in log:
-            logger.info(log['stream'].strip())
-    return image
+    _ensure_dockerignore(build_context)
+    command = [
+        "docker", "buildx", "build",
+        "--progress=plain",
+        "--file", os.path.join(build_context, dockerfile_path),
+        "--tag", image_name,
+        "--load",
+    ]
+    if cache_ref:
+        command += [
+            "--cache-from", f"type=registry,ref={cache_ref}",
+            "--cache-to", f"type=registry,ref={cache_ref},mode=max",
+        ]
+    run_command(command + [build_context])
+    return _docker().images.get(image_name)
 
 
 def tag_docker_image(image, repository, tag):
@@ -216,6 +808,39 @@ def tag_docker_image(image, repository, tag):
     image.tag(repository, tag)
 
 
+def _log_push_progress(frames):
+    """
+    Log the progress stream of a Docker push.
+
+    Byte-level progress frames are summarized at most once every
+    PUSH_LOG_INTERVAL seconds; status and error frames are logged as they
+    arrive, after any progress still pending.
+
+    Args:
+        frames (iterable): Decoded JSON frames from `client.images.push`.
+    """
+    pending = 0
+    last_frame = None
+    last_flush = time.monotonic()
+    for frame in frames:
+        progress = 'error' not in frame and frame.get('progressDetail')
+        if progress:
+            pending += 1
+            last_frame = frame
+        now = time.monotonic()
+        # Flush before any status or error frame so the log stays in order.
+        if pending and (not progress or now - last_flush >= PUSH_LOG_INTERVAL):
+            logger.info(f"{pending} progress frames, last: {last_frame}")
+            pending = 0
+            last_flush = now
+        if 'error' in frame:
+            logger.error(frame)
+        elif not progress:
+            logger.info(frame)
+    if pending:
+        logger.info(f"{pending} progress frames, last: {last_frame}")
+
+
 def push_docker_image(repository, tag, username, password):
     """
     Push a Docker image to a registry.
@@ -227,10 +852,10 @@ def push_docker_image(repository, tag, username, password):
         password (str): Docker registry password.
     """
     logger.info(f"Pushing Docker image: {repository}:{tag}")
-    client = docker.from_env()
+    client = _docker()
     # client.login(username=username, password=password)
-    for line in client.images.push(repository, tag, stream=True, decode=True):
-        logger.info(line)
+    _log_push_progress(
+        client.images.push(repository, tag, stream=True, decode=True))
 
 
 def main():
@@ -240,7 +865,7 @@ def main():
     This function performs the following steps:
     1. Parses command-line arguments.
     2. Loads configuration from file.
-    3. Creates a virtual environment.
+    3. Creates a virtual environment, or reuses a cached one.
     4. Installs dependencies.
     5. Runs unit tests.
     6. Builds a Docker image.
@@ -251,12 +876,14 @@ def main():
     If any step fails, it logs the error and exits with a non-zero status.
     """
     args = parse_arguments()
-    config = load_config(args.config)
 
     try:
-        create_venv(args.venv)
+        config = load_config(args.config)
+        prepare_venv(
+            args.venv, args.requirements, args.parallel,
+            use_cache=not args.no_venv_cache
+        )
         venv_python = get_venv_python(args.venv)
-        install_dependencies(venv_python, args.requirements)
         run_tests(venv_python, args.test_dir)
 
         # Docker operations
@@ -267,7 +894,8 @@ def main():
         password = config['Docker']['Password']
 
         image = build_docker_image(
-            image_name, args.dockerfile, args.build_context)
+            image_name, args.dockerfile, args.build_context,
+            args.build_cache)
         tag_docker_image(image, repository, tag)
         push_docker_image(repository, tag, username, password)
 
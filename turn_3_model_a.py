@@ -1,11 +1,27 @@
 #!/usr/bin/env python3
+import atexit
 import configparser
-import docker
+import copy
+import ensurepip
+import functools
+import glob
+import hashlib
+import importlib.util
+import json
 import logging
 import os
-import requests
+import shutil
+import subprocess
 import sys
+import time
 import venv
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
 
 # Set up logging
 logging.basicConfig(
@@ -16,45 +32,374 @@ logger = logging.getLogger(__name__)
 
 # Configuration
 CONFIG_FILE = os.environ.get('CONFIG_FILE', 'config.ini')
-VENV_NAME = os.environ.get('VENV_NAME', 'venv')
+VENV_NAME = os.environ.get('VENV_NAME')
 REQUIREMENTS_FILE = os.environ.get('REQUIREMENTS_FILE', 'requirements.txt')
 TEST_DIR = os.environ.get('TEST_DIR', 'tests')
 DOCKERFILE = os.environ.get('DOCKERFILE', 'Dockerfile')
 BUILD_CONTEXT = os.environ.get('BUILD_CONTEXT', '.')
+BUILD_CACHE_REF = os.environ.get('BUILD_CACHE_REF')
+VENV_CACHE_DIR = os.environ.get(
+    'VENV_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'build-venvs')
+)
+WHEEL_CACHE_DIR = os.environ.get(
+    'WHEEL_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'build-wheels')
+)
+VENV_COMPLETE_MARKER = '.build-complete'
+VENV_SEED_DIR = os.environ.get(
+    'VENV_SEED_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'venv-seed')
+)
+VENV_CONTEXT_DIR = os.environ.get(
+    'VENV_CONTEXT_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'build-contexts')
+)
+
+# Compiles the venv's site-packages on all CPUs once installs have finished.
+# Like pip's own compile step, files that fail to compile are not an error.
+COMPILE_SITE_PACKAGES = (
+    "import compileall, sysconfig\n"
+    "paths = {sysconfig.get_path('purelib'), sysconfig.get_path('platlib')}\n"
+    "for path in paths:\n"
+    "    compileall.compile_dir(path, quiet=1, workers=0)"
+)
 
 # Docker configuration
 DOCKER_USERNAME = os.environ.get('DOCKER_USERNAME')
 DOCKER_PASSWORD = os.environ.get('DOCKER_PASSWORD')
+DOCKER_API_VERSION = os.environ.get('DOCKER_API_VERSION', 'auto')
+_DOCKER_CLIENT = None
+
+# Minimum interval, in seconds, between push progress log lines
+PUSH_LOG_INTERVAL = 0.1
+
+# Patterns kept out of the Docker build context
+DOCKERIGNORE_ENTRIES = [
+    "venv/", ".venv/", "**/__pycache__/", "**/*.pyc", ".pytest_cache/", ".git/"
+]
 
 # Slack configuration for notifications
 SLACK_WEBHOOK_URL = os.environ.get('SLACK_WEBHOOK_URL')
+_SLACK_EXECUTOR = None
+_SLACK_SESSION = None
 
 
-def load_config(config_file):
+def _default_venv_path(build_context):
     """
-    Load configuration from a file.
+    Get the default virtual environment path for a build context.
+
+    The path lives in VENV_CONTEXT_DIR, outside the build context, and is
+    derived from the context's absolute path so that re-runs of the same
+    build reuse it. Unlike the shared temp directory, VENV_CONTEXT_DIR is
+    owned by the current user, so nobody else can plant a venv there.
 
     Args:
-        config_file (str): Path to the configuration file.
+        build_context (str): Path to the build context.
 
     Returns:
-        configparser.ConfigParser: Parsed configuration.
+        str: Path for the virtual environment.
     """
-    logger.info(f"Loading configuration from {config_file}")
+    os.makedirs(VENV_CONTEXT_DIR, mode=0o700, exist_ok=True)
+    digest = hashlib.blake2b(
+        os.path.abspath(build_context).encode(), digest_size=8)
+    return os.path.join(VENV_CONTEXT_DIR, f"venv-{digest.hexdigest()}")
+
+
+def _loads_simple_toml(document):
+    """
+    Parse TOML with configparser, for Pythons without tomllib.
+
+    Only the subset written by `save_config` is understood: one level of
+    tables holding basic strings, integers and booleans.
+
+    Args:
+        document (str): The TOML document.
+
+    Returns:
+        dict: Parsed configuration.
+
+    Raises:
+        ValueError: If the document uses TOML outside that subset.
+    """
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.optionxform = str  # TOML keys are case-sensitive
+    try:
+        parser.read_string(document)
+    except configparser.Error as e:
+        raise ValueError(f"Unsupported TOML without tomllib: {e}") from e
+
+    def name(key):
+        if key.startswith('"'):
+            return json.loads(key)
+        if not (key.isascii()
+                and key.replace("_", "").replace("-", "").isalnum()):
+            raise ValueError(f"Unsupported TOML key without tomllib: {key}")
+        return key
+
+    config = {}
+    for section in parser.sections():
+        table = config[name(section)] = {}
+        for key, value in parser.items(section):
+            if value in ("true", "false"):
+                table[name(key)] = value == "true"
+                continue
+            try:
+                # TOML basic strings and integers are valid JSON.
+                parsed = json.loads(value)
+            except ValueError:
+                parsed = None
+            if not isinstance(parsed, (str, int)) or isinstance(parsed, bool):
+                raise ValueError(
+                    f"Unsupported TOML value for {section}.{key} without "
+                    f"tomllib: {value}")
+            table[name(key)] = parsed
+    return config
+
+
+@functools.lru_cache(maxsize=32)
+def _read_config(config_file, file_id):
+    """
+    Parse a configuration file, memoized on its identity and mtime.
+
+    Files ending in .toml are parsed with tomllib, or with
+    `_loads_simple_toml` on Python < 3.11, anything else as INI with
+    configparser. The file is only re-read once it is replaced or its size
+    or modification time changes; `load_config` hands callers copies of the
+    cached result.
+
+    Args:
+        config_file (str): Absolute path to the configuration file.
+        file_id (tuple): The file's inode, size and modification time in
+            nanoseconds, or None if the file does not exist.
+
+    Returns:
+        dict or configparser.ConfigParser: Parsed configuration.
+
+    Raises:
+        ValueError: If a TOML file can't be parsed.
+    """
+    if config_file.endswith(".toml"):
+        if file_id is None:
+            return {}
+        if tomllib is None:
+            with open(config_file, encoding="utf-8") as f:
+                return _loads_simple_toml(f.read())
+        with open(config_file, "rb") as f:
+            return tomllib.load(f)
     config = configparser.ConfigParser()
     config.read(config_file)
     return config
 
 
+def load_config(config_file):
+    """
+    Load configuration from a file.
+
+    Args:
+        config_file (str): Path to the configuration file, either TOML or INI.
+
+    Returns:
+        dict or configparser.ConfigParser: Parsed configuration.
+    """
+    logger.info(f"Loading configuration from {config_file}")
+    # Key on the absolute path so a relative name read from different
+    # working directories isn't served from the wrong project's entry.
+    config_file = os.path.abspath(config_file)
+    try:
+        stat = os.stat(config_file)
+    except FileNotFoundError:
+        file_id = None
+    else:
+        file_id = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    # Callers may modify the configuration, so never hand out the cached one.
+    return copy.deepcopy(_read_config(config_file, file_id))
+
+
+# Script installed as <venv>/bin/pip by SeededEnvBuilder
+PIP_SCRIPT = """#!{python}
+import sys
+from pip._internal.cli.main import main
+sys.exit(main())
+"""
+
+
+class SeededEnvBuilder(venv.EnvBuilder):
+    """
+    Virtual environment builder that links pip in from a shared seed.
+
+    Rather than running ensurepip, which unpacks pip's bundled wheel into
+    every new environment, the unpacked wheel in `pip_seed` is symlinked
+    into the environment's site-packages.
+    """
+
+    def __init__(self, pip_seed):
+        super().__init__(with_pip=False, symlinks=True)
+        self.pip_seed = pip_seed
+
+    def post_setup(self, context):
+        site_packages = os.path.join(
+            context.env_dir, "lib",
+            f"python{sys.version_info[0]}.{sys.version_info[1]}",
+            "site-packages"
+        )
+        for name in os.listdir(self.pip_seed):
+            os.symlink(
+                os.path.join(self.pip_seed, name),
+                os.path.join(site_packages, name)
+            )
+        pip_script = os.path.join(context.bin_path, "pip")
+        with open(pip_script, "w") as f:
+            f.write(PIP_SCRIPT.format(python=context.env_exe))
+        os.chmod(pip_script, 0o755)
+
+
+def _pip_seed(seed_dir):
+    """
+    Get a directory holding an unpacked copy of ensurepip's pip wheel.
+
+    The wheel is extracted into `seed_dir` on first use and reused by every
+    environment created afterwards.
+
+    Args:
+        seed_dir (str): Directory in which unpacked wheels are kept.
+
+    Returns:
+        str: Path to the unpacked wheel, or None if this Python does not
+        bundle a pip wheel.
+    """
+    bundled = os.path.join(os.path.dirname(ensurepip.__file__), "_bundled")
+    wheels = glob.glob(os.path.join(bundled, "pip-*.whl"))
+    if not wheels:
+        return None
+    pip_seed = os.path.join(
+        seed_dir, os.path.splitext(os.path.basename(wheels[0]))[0])
+    if not os.path.isdir(pip_seed):
+        logger.info(f"Unpacking {wheels[0]} into {pip_seed}")
+        unpack_dir = f"{pip_seed}.tmp-{os.getpid()}"
+        with zipfile.ZipFile(wheels[0]) as wheel:
+            wheel.extractall(unpack_dir)
+        try:
+            os.rename(unpack_dir, pip_seed)
+        except OSError:
+            # Another build unpacked the wheel first.
+            shutil.rmtree(unpack_dir, ignore_errors=True)
+    return pip_seed
+
+
+def _toml_key(key):
+    """
+    Format a TOML key, quoting it unless it is a valid bare key.
+
+    Args:
+        key (str): The key to format.
+
+    Returns:
+        str: The key as it should appear in a TOML document.
+    """
+    if key and key.isascii() and key.replace("_", "").replace("-", "").isalnum():
+        return key
+    # TOML has no surrogate-pair escapes, so keep non-ASCII characters as-is.
+    return json.dumps(key, ensure_ascii=False)
+
+
+def _dump_toml(config):
+    """
+    Serialize configuration as a TOML document.
+
+    Only one level of tables holding strings, integers and booleans is
+    supported, which is all the Docker settings need.
+
+    Args:
+        config (dict): Configuration as returned by `load_config`.
+
+    Returns:
+        str: The TOML document.
+
+    Raises:
+        ValueError: If the configuration can't be written in this form, or
+            doesn't read back unchanged.
+    """
+    lines = []
+    for section, values in config.items():
+        if not isinstance(values, dict):
+            raise ValueError(
+                f"Cannot write top-level key {section!r}; only tables are "
+                "supported.")
+        lines.append(f"[{_toml_key(section)}]")
+        for key, value in values.items():
+            if not isinstance(value, (str, int, bool)):
+                raise ValueError(
+                    f"Cannot write {section}.{key} of type "
+                    f"{type(value).__name__}; only strings, integers and "
+                    "booleans are supported.")
+            # JSON string, integer and boolean literals are valid TOML.
+            lines.append(
+                f"{_toml_key(key)} = {json.dumps(value, ensure_ascii=False)}")
+    document = "\n".join(lines) + "\n"
+    # Raises UnicodeEncodeError, a ValueError, for lone surrogates.
+    document.encode("utf-8")
+    loads = tomllib.loads if tomllib else _loads_simple_toml
+    if loads(document) != config:
+        raise ValueError("Configuration does not round-trip through TOML.")
+    return document
+
+
+def save_config(config, config_file):
+    """
+    Write configuration back to a file.
+
+    TOML configuration is serialized and checked in full before the file is
+    opened, so an unsupported value leaves the existing file untouched.
+
+    Args:
+        config (dict or configparser.ConfigParser): Configuration as returned
+            by `load_config`.
+        config_file (str): Path to the configuration file.
+
+    Raises:
+        ValueError: If TOML configuration can't be written back faithfully.
+    """
+    if isinstance(config, configparser.ConfigParser):
+        with open(config_file, 'w') as f:
+            config.write(f)
+        return
+    document = _dump_toml(config)
+    with open(config_file, 'w', encoding='utf-8') as f:
+        f.write(document)
+
+
 def create_venv(venv_name):
     """
     Create a virtual environment.
 
+    Does nothing if `venv_name` already holds a virtual environment. Uses
+    virtualenv when it is installed. Otherwise pip is linked in from
+    VENV_SEED_DIR by SeededEnvBuilder, falling back to venv.create with
+    ensurepip on Windows or when no pip wheel is bundled with Python.
+
     Args:
         venv_name (str): The name of the virtual environment to create.
     """
+    if (os.path.isfile(os.path.join(venv_name, "pyvenv.cfg"))
+            and os.path.isfile(get_venv_python(venv_name))):
+        logger.info(f"Reusing existing virtual environment: {venv_name}")
+        return
     logger.info(f"Creating virtual environment: {venv_name}")
-    venv.create(venv_name, with_pip=True)
+    try:
+        import virtualenv
+    except ImportError:
+        pip_seed = None
+        if sys.platform != "win32":
+            pip_seed = _pip_seed(VENV_SEED_DIR)
+        if pip_seed:
+            SeededEnvBuilder(pip_seed).create(venv_name)
+        else:
+            venv.create(venv_name, with_pip=True)
+    else:
+        # virtualenv seeds pip from its cached wheel image instead of
+        # unpacking the bundled wheels through ensurepip on every run.
+        virtualenv.cli_run([venv_name, "--no-periodic-update"])
 
 
 def get_venv_python(venv_name):
@@ -72,28 +417,172 @@ def get_venv_python(venv_name):
     return os.path.join(venv_name, "bin", "python")
 
 
-def install_dependencies(venv_python, requirements_file):
+def install_dependencies(venv_python, requirements_file, wheel_dir=None):
     """
-    Install dependencies listed in the requirements file using pip.
+    Install dependencies listed in the requirements file.
+
+    Uses `uv pip install` when uv is on the PATH, otherwise pip. Bytecode
+    is not compiled during the install but afterwards in a single pass
+    spread across all CPUs.
 
     Args:
         venv_python (str): Path to the Python executable in the virtual environment.
         requirements_file (str): Path to the requirements file.
+        wheel_dir (str, optional): Directory of prebuilt wheels to install
+            from. The package index stays available for anything the
+            wheels don't cover, such as build dependencies.
 
     Raises:
         FileNotFoundError: If the requirements file does not exist.
+        subprocess.CalledProcessError: If the dependencies fail to install.
     """
     if os.path.exists(requirements_file):
         logger.info(f"Installing dependencies from {requirements_file}")
-        os.system(f"{venv_python} -m pip install -r {requirements_file}")
+        uv = shutil.which("uv")
+        if uv:
+            command = [uv, "pip", "install", "--python", venv_python]
+        else:
+            command = [venv_python, "-m", "pip", "install", "--no-compile"]
+        if wheel_dir:
+            command += ["--find-links", wheel_dir]
+        subprocess.run(command + ["-r", requirements_file], check=True)
+        subprocess.run([venv_python, "-c", COMPILE_SITE_PACKAGES], check=True)
     else:
         raise FileNotFoundError(
             f"Requirements file {requirements_file} not found.")
 
 
+def _build_venv(venv_name, requirements_file):
+    """
+    Create a virtual environment and install its dependencies.
+
+    While the environment is being created, the host pip builds wheels for
+    the requirements into WHEEL_CACHE_DIR, and they are then installed from
+    there. The index is not disabled for the install, since source
+    requirements such as `-e .` still need it to fetch their build
+    dependencies. The two steps simply run in turn when uv is available (it
+    has its own parallel downloader), when the host has no pip, or when
+    there is no requirements file.
+
+    Args:
+        venv_name (str): The name of the virtual environment to create.
+        requirements_file (str): Path to the requirements file.
+    """
+    prefetch = (
+        os.path.exists(requirements_file)
+        and not shutil.which("uv")
+        and importlib.util.find_spec("pip") is not None
+    )
+    if not prefetch:
+        create_venv(venv_name)
+        install_dependencies(
+            get_venv_python(venv_name), requirements_file)
+        return
+
+    os.makedirs(WHEEL_CACHE_DIR, exist_ok=True)
+    prefetch_command = [
+        sys.executable, "-m", "pip", "wheel", "--quiet",
+        "--wheel-dir", WHEEL_CACHE_DIR, "-r", requirements_file
+    ]
+    with subprocess.Popen(prefetch_command) as prefetch_process:
+        try:
+            create_venv(venv_name)
+        except BaseException:
+            # Don't let Popen.__exit__ wait for the whole prefetch to finish.
+            prefetch_process.kill()
+            raise
+        returncode = prefetch_process.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, prefetch_command)
+    install_dependencies(
+        get_venv_python(venv_name), requirements_file,
+        wheel_dir=WHEEL_CACHE_DIR)
+
+
+def _venv_cache_key(requirements_file):
+    """
+    Compute the cache key for a virtual environment.
+
+    The key covers the requirements file contents and the interpreter the
+    environment is created from, since a venv is tied to its base Python.
+
+    Args:
+        requirements_file (str): Path to the requirements file.
+
+    Returns:
+        str: Hex digest identifying the cached virtual environment.
+    """
+    with open(requirements_file, 'rb') as f:
+        digest = hashlib.blake2b(f.read(), digest_size=16)
+    digest.update(sys.executable.encode())
+    return digest.hexdigest()
+
+
+def prepare_venv(venv_name, requirements_file):
+    """
+    Create a virtual environment with its dependencies installed.
+
+    Environments are cached under VENV_CACHE_DIR by the hash of the
+    requirements file and `venv_name` is symlinked to the cached copy. On a
+    cache miss the environment is built in place, since venvs can't be moved
+    once scripts reference their path. Builds of the same entry are
+    serialized with a lock file, and an entry only counts as a hit once its
+    VENV_COMPLETE_MARKER exists. An existing directory at `venv_name`
+    bypasses the cache and is used as-is, while a link left by an earlier
+    cached build is removed before building outside the cache.
+
+    Args:
+        venv_name (str): The name of the virtual environment to create.
+        requirements_file (str): Path to the requirements file.
+    """
+    cacheable = (
+        os.path.exists(requirements_file)
+        and (os.path.islink(venv_name) or not os.path.exists(venv_name))
+    )
+    if not cacheable:
+        if os.path.islink(venv_name):
+            # Don't build through a link into a cache entry keyed by other
+            # requirements.
+            os.unlink(venv_name)
+        _build_venv(venv_name, requirements_file)
+        return
+
+    cached_venv = os.path.abspath(os.path.join(
+        VENV_CACHE_DIR, _venv_cache_key(requirements_file)))
+    complete_marker = os.path.join(cached_venv, VENV_COMPLETE_MARKER)
+    os.makedirs(VENV_CACHE_DIR, exist_ok=True)
+    with open(f"{cached_venv}.lock", "w") as lock_file:
+        try:
+            import fcntl
+        except ImportError:  # Windows
+            pass
+        else:
+            # Wait for any other build of this entry to finish.
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        if os.path.exists(complete_marker):
+            logger.info(f"Reusing cached virtual environment: {cached_venv}")
+        else:
+            # Anything already here is left over from an interrupted build.
+            shutil.rmtree(cached_venv, ignore_errors=True)
+            try:
+                _build_venv(cached_venv, requirements_file)
+            except Exception:
+                shutil.rmtree(cached_venv, ignore_errors=True)
+                raise
+            open(complete_marker, "w").close()
+
+    if os.path.islink(venv_name):
+        os.unlink(venv_name)
+    os.symlink(cached_venv, venv_name, target_is_directory=True)
+
+
 def run_tests(venv_python, test_dir):
     """
-    Run unit tests using the unittest framework.
+    Run unit tests.
+
+    When pytest and pytest-xdist are installed in the virtual environment,
+    the tests are distributed across all CPUs with `pytest -n auto`.
+    Otherwise they are run with the unittest framework.
 
     Args:
         venv_python (str): Path to the Python executable in the virtual environment.
@@ -103,43 +592,111 @@ def run_tests(venv_python, test_dir):
         subprocess.CalledProcessError: If the tests fail.
     """
     logger.info("Running unit tests")
-    result = os.system(f"{venv_python} -m unittest discover {test_dir}")
-    if result != 0:
-        raise subprocess.CalledProcessError(
-            result, f"{venv_python} -m unittest discover {test_dir}")
+    probe = subprocess.run(
+        [venv_python, "-c", "import pytest, xdist"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    if probe.returncode == 0:
+        # Match unittest's default discovery pattern so test.py is collected.
+        command = [
+            venv_python, "-m", "pytest", "-n", "auto", "--dist=loadfile",
+            "-o", "python_files=test*.py", test_dir
+        ]
+    else:
+        command = [venv_python, "-m", "unittest", "discover", test_dir]
+    subprocess.run(command, check=True)
 
 
-def build_docker_image(image_name, dockerfile_path, build_context):
+def _docker():
     """
-    Build a Docker image.
+    Get the Docker client shared by all image operations.
+
+    The client is created on first use so the connection pool (and the API
+    version negotiation, unless DOCKER_API_VERSION is pinned) is reused
+    across the build, tag and push steps.
+
+    Returns:
+        docker.DockerClient: Client connected to the Docker daemon.
+    """
+    # Imported here so that runs which never touch Docker (such as --help)
+    # don't pay for loading docker-py and its HTTP stack.
+    import docker
+
+    global _DOCKER_CLIENT
+    if _DOCKER_CLIENT is None:
+        _DOCKER_CLIENT = docker.from_env(
+            version=DOCKER_API_VERSION, timeout=120)
+    return _DOCKER_CLIENT
+
+
+def _ensure_dockerignore(build_context):
+    """
+    Make sure the build context's .dockerignore excludes build artifacts.
+
+    Missing DOCKERIGNORE_ENTRIES are prepended to the file, so that any
+    exceptions the project adds later in the file still take precedence.
+
+    Args:
+        build_context (str): Path to the build context.
+    """
+    dockerignore = os.path.join(build_context, ".dockerignore")
+    content = ""
+    if os.path.exists(dockerignore):
+        with open(dockerignore) as f:
+            content = f.read()
+    existing = content.splitlines()
+    missing = [entry for entry in DOCKERIGNORE_ENTRIES if entry not in existing]
+    if missing:
+        logger.info(f"Adding {', '.join(missing)} to {dockerignore}")
+        with open(dockerignore, "w") as f:
+            f.write("\n".join(missing) + "\n" + content)
+
+
+def build_docker_image(image_name, dockerfile_path, build_context,
+                       cache_ref=None):
+    """
+    Build a Docker image with BuildKit.
+
+    Shells out to `docker buildx build`, which streams the build context to
+    the daemon instead of materializing it as an in-memory tarball. When
+    `cache_ref` is given, layers are also read from and exported to that
+    registry reference. Build artifacts such as virtual environments are
+    added to the context's .dockerignore first.
 
     Args:
         image_name (str): Name for the Docker image.
-        dockerfile_path (str): Path to the Dockerfile.
+        dockerfile_path (str): Path to the Dockerfile, relative to the build
+            context.
         build_context (str): Path to the build context.
+        cache_ref (str, optional): Registry reference used as the layer cache.
 
     Returns:
         docker.models.images.Image: Built Docker image.
 
     Raises:
-        docker.errors.BuildError: If the Docker build fails.
+        subprocess.CalledProcessError: If the Docker build fails.
     """
     logger.info(f"Building Docker image: {image_name}")
-    client = docker.from_env()
+    _ensure_dockerignore(build_context)
+    command = [
+        "docker", "buildx", "build",
+        "--progress=plain",
+        "--file", os.path.join(build_context, dockerfile_path),
+        "--tag", image_name,
+        "--load",
+    ]
+    if cache_ref:
+        command += [
+            "--cache-from", f"type=registry,ref={cache_ref}",
+            "--cache-to", f"type=registry,ref={cache_ref},mode=max",
+        ]
     try:
-        image, build_logs = client.images.build(
-            path=build_context,
-            dockerfile=dockerfile_path,
-            tag=image_name,
-            rm=True
-        )
-        for log in build_logs:
-            if 'stream' in log:
-                logger.info(log['stream'].strip())
-        return image
-    except docker.errors.BuildError as e:
+        subprocess.run(command + [build_context], check=True)
+    except subprocess.CalledProcessError as e:
         logger.error(f"Docker build failed: {str(e)}")
         raise
+    return _docker().images.get(image_name)
 
 
 def tag_docker_image(image, repository, tag):
@@ -154,6 +711,8 @@ def tag_docker_image(image, repository, tag):
     Raises:
         docker.errors.APIError: If tagging the image fails.
     """
+    import docker
+
     logger.info(f"Tagging Docker image: {repository}:{tag}")
     try:
         image.tag(repository, tag)
@@ -162,47 +721,122 @@ def tag_docker_image(image, repository, tag):
         raise
 
 
+def _log_push_progress(frames):
+    """
+    Log the progress stream of a Docker push.
+
+    Byte-level progress frames are summarized at most once every
+    PUSH_LOG_INTERVAL seconds; status and error frames are logged as they
+    arrive, after any progress still pending.
+
+    Args:
+        frames (iterable): Decoded JSON frames from `client.images.push`.
+
+    Returns:
+        str: The last error reported by the daemon, or None if the push
+        succeeded.
+    """
+    pending = 0
+    last_frame = None
+    last_flush = time.monotonic()
+    error = None
+    for frame in frames:
+        progress = 'error' not in frame and frame.get('progressDetail')
+        if progress:
+            pending += 1
+            last_frame = frame
+        now = time.monotonic()
+        # Flush before any status or error frame so the log stays in order.
+        if pending and (not progress or now - last_flush >= PUSH_LOG_INTERVAL):
+            logger.info(f"{pending} progress frames, last: {last_frame}")
+            pending = 0
+            last_flush = now
+        if 'error' in frame:
+            logger.error(frame)
+            error = frame['error']
+        elif not progress:
+            logger.info(frame)
+    if pending:
+        logger.info(f"{pending} progress frames, last: {last_frame}")
+    return error
+
+
 def push_docker_image(repository, tag, username, password):
     """
     Push a Docker image to a registry.
 
+    The credentials are sent with the push request itself rather than through
+    a separate login call, saving an authentication round trip. Without them
+    the daemon falls back to the credentials in ~/.docker/config.json.
+
     Args:
         repository (str): Repository name.
         tag (str): Tag of the image to push.
-        username (str): Docker registry username.
-        password (str): Docker registry password.
+        username (str, optional): Docker registry username.
+        password (str, optional): Docker registry password.
 
     Raises:
         docker.errors.APIError: If pushing the image fails.
     """
+    import docker
+
     logger.info(f"Pushing Docker image: {repository}:{tag}")
-    client = docker.from_env()
+    client = _docker()
+    auth_config = None
+    if username and password:
+        auth_config = {'username': username, 'password': password}
     try:
-        client.login(username=username, password=password)
-        for line in client.images.push(repository, tag, stream=True, decode=True):
-            logger.info(line)
+        error = _log_push_progress(client.images.push(
+            repository, tag, auth_config=auth_config,
+            stream=True, decode=True))
+        if error:
+            raise docker.errors.APIError(error)
     except docker.errors.APIError as e:
         logger.error(f"Failed to push Docker image: {str(e)}")
         raise
 
 
-def send_slack_notification(message):
+def _post_slack_message(message):
     """
-    Send a notification to Slack.
+    Post a message to the Slack webhook, logging the outcome.
+
+    Runs on the Slack worker thread, the only user of the pooled session.
 
     Args:
         message (str): The message to send.
+    """
+    import requests
 
-    Raises:
-        requests.RequestException: If sending the Slack message fails.
+    try:
+        response = _SLACK_SESSION.post(
+            SLACK_WEBHOOK_URL, json={"text": message}, timeout=5)
+        response.raise_for_status()
+        logger.info("Slack notification sent successfully")
+    except requests.RequestException as e:
+        logger.error(f"Failed to send Slack notification: {str(e)}")
+
+
+def send_slack_notification(message):
+    """
+    Send a notification to Slack in the background.
+
+    Messages are posted in order by a single worker thread that reuses one
+    HTTP connection, so the build does not wait on Slack. Pending messages
+    are still delivered before the interpreter exits; failures are logged.
+
+    Args:
+        message (str): The message to send.
     """
+    global _SLACK_EXECUTOR, _SLACK_SESSION
     if SLACK_WEBHOOK_URL:
-        try:
-            response = requests.post(SLACK_WEBHOOK_URL, json={"text": message})
-            response.raise_for_status()
-            logger.info("Slack notification sent successfully")
-        except requests.RequestException as e:
-            logger.error(f"Failed to send Slack notification: {str(e)}")
+        if _SLACK_EXECUTOR is None:
+            import requests
+
+            _SLACK_SESSION = requests.Session()
+            atexit.register(_SLACK_SESSION.close)
+            _SLACK_EXECUTOR = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="slack")
+        _SLACK_EXECUTOR.submit(_post_slack_message, message)
     else:
         logger.warning(
             "Slack webhook URL not configured. Skipping notification.")
@@ -237,10 +871,11 @@ def main():
     config = load_config(CONFIG_FILE)
     previous_tag = config['Docker']['Tag']
 
+    venv_name = VENV_NAME or _default_venv_path(BUILD_CONTEXT)
+
     try:
-        create_venv(VENV_NAME)
-        venv_python = get_venv_python(VENV_NAME)
-        install_dependencies(venv_python, REQUIREMENTS_FILE)
+        prepare_venv(venv_name, REQUIREMENTS_FILE)
+        venv_python = get_venv_python(venv_name)
         run_tests(venv_python, TEST_DIR)
 
         # Docker operations
@@ -248,15 +883,19 @@ def main():
         repository = config['Docker']['Repository']
         new_tag = f"v{config['Docker']['Version']}"
 
-        image = build_docker_image(image_name, DOCKERFILE, BUILD_CONTEXT)
+        # Check the updated config can be written before anything is pushed.
+        config['Docker']['Tag'] = new_tag
+        if not isinstance(config, configparser.ConfigParser):
+            _dump_toml(config)
+
+        image = build_docker_image(
+            image_name, DOCKERFILE, BUILD_CONTEXT, BUILD_CACHE_REF)
         tag_docker_image(image, repository, new_tag)
         push_docker_image(repository, new_tag,
                           DOCKER_USERNAME, DOCKER_PASSWORD)
 
         # Update config with new version
-        config['Docker']['Tag'] = new_tag
-        with open(CONFIG_FILE, 'w') as configfile:
-            config.write(configfile)
+        save_config(config, CONFIG_FILE)
 
         logger.info("Build and deployment process completed successfully!")
         send_slack_notification("Deployment successful! 🎉")